@@ -17,9 +17,21 @@ Usage Examples:
 2. Interactive mode (prompts for each setting):
     python font_tool.py
 
+   Or, for scripted runs, read every setting from a file instead:
+    python font_tool.py --config settings.toml
+
 3. Silent WOFF2 conversion only:
     python font_tool.py -w input_font.ttf
 
+4. WOFF2 conversion at maximum Brotli quality:
+    python font_tool.py -w -q 11 input_font.ttf
+
+5. WOFF2 conversion of a whole family (fonts are converted in parallel):
+    python font_tool.py -w Family-Regular.ttf Family-Bold.ttf Family-Italic.ttf
+
+6. Renaming every font in a directory (fonts are processed in parallel):
+    python font_tool.py fonts/ --family "NewFamilyName" --license OFL
+
 Dependencies:
     - fontTools
     - Typer
@@ -30,9 +42,9 @@ About WOFF2 and Brotli Compression:
 -----------------------------------
 WOFF2 files are always compressed with the Brotli algorithm (as defined by the WOFF2 spec).
 FontTools automatically uses Brotli to compress font data into WOFF2 if the 'brotli' library
-is installed. You can optionally set an environment variable like WOFF2_COMPRESSION_LEVEL=9
-for maximum compression (or pass parameters directly if you call the lower-level API).
-By default, FontTools chooses a balanced Brotli compression level.
+is installed. Left alone, FontTools compresses at the maximum quality (11), which is by far
+the slowest setting; this tool defaults to quality 8 instead. Pass --quality / -q (0-11)
+to choose another level, e.g. -q 11 for the smallest possible file.
 
 Good practice is to include at least the following metadata in a font:
   - Family Name (nameID 1) and Typographic Family (nameID 16)
@@ -50,23 +62,79 @@ Additional fields (like Designer, Manufacturer, Description, etc.) may be includ
 import sys
 import os
 import datetime
+import functools
+import hashlib
+import json
+import mmap
+import shutil
+import tomllib
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from enum import Enum
-from dataclasses import dataclass
-from typing import Optional, cast, List
+from types import MappingProxyType
+from dataclasses import asdict, dataclass, fields
+from typing import TYPE_CHECKING, Optional, List
 
-import typer
-from rich.console import Console
-from fontTools.ttLib import TTFont
+# fontTools, Rich and typer are imported where they are first needed, so that
+# e.g. `--help` does not pay for loading fontTools and Rich.
+if TYPE_CHECKING:
+	import typer
+	from fontTools.ttLib import TTFont
+	from fontTools.ttLib.tables._n_a_m_e import NameRecord, table__n_a_m_e
+	from rich.console import Console
 
-# Import the woff2 submodule for compression
-from fontTools.ttLib import woff2
-from fontTools.ttLib.tables._n_a_m_e import table__n_a_m_e
 
-app = typer.Typer(help="Font metadata modification tool")
-console = Console()
+@functools.cache
+def console() -> "Console":
+	"""Return the shared Rich console, creating it on first use."""
+	from rich.console import Console
+
+	return Console()
+
 
 # Allowed name table IDs (only these will remain after processing)
-ALLOWED_NAME_IDS = {0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 16, 17, 13, 14}
+ALLOWED_NAME_IDS = frozenset({0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 16, 17, 13, 14})
+
+# Name IDs whose current values are offered as defaults in interactive mode
+PROMPTED_NAME_IDS = frozenset({0, 1, 2, 7, 8, 9, 13, 14})
+
+# Brotli quality used for WOFF2 output. 11 is the slowest setting and usually
+# only a few percent smaller than 8.
+DEFAULT_WOFF2_QUALITY = 8
+
+# Characters removed when building a PostScript name: space plus the
+# delimiters the PostScript name spec forbids.
+PS_NAME_STRIP = str.maketrans("", "", " ()<>[]{}/%")
+
+# Input fonts larger than this are memory-mapped, so that only the pages
+# holding the tables that are actually read get loaded
+MMAP_MIN_SIZE = 8 * 1024 * 1024
+
+# First four bytes of the font files TTFont can open (TrueType, CFF, WOFF,
+# WOFF2, Apple 'true' and 'typ1')
+FONT_SIGNATURES = frozenset(
+	{b"\x00\x01\x00\x00", b"OTTO", b"wOFF", b"wOF2", b"true", b"typ1"}
+)
+
+# Extensions of the files picked up when a directory is given as input
+FONT_EXTENSIONS = frozenset({".otf", ".ttf", ".woff", ".woff2"})
+
+# Index of previously processed fonts, used to skip re-processing unchanged
+# inputs (see _cache_key)
+CACHE_PATH = os.path.join(
+	os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+	"metafont",
+	"index.json",
+)
+
+# Most entries kept in the cache index; the oldest are evicted first
+CACHE_MAX_ENTRIES = 1000
+
+# Part of every cache key; bump it whenever the output for the same input and
+# settings changes, so that outputs from older versions aren't reused
+CACHE_VERSION = 1
+
+# Year used in generated copyright notices (fixed for the life of the process)
+CURRENT_YEAR = datetime.date.today().year
 
 
 # License types
@@ -77,45 +145,127 @@ class LicenseType(str, Enum):
 	CUSTOM = "Custom"
 
 
-# Predefined license information for non-custom licenses.
-LICENSE_INFO = {
-	LicenseType.OFL: {
-		"text": "This Font Software is licensed under the SIL Open Font License, Version 1.1.",
-		"url": "http://scripts.sil.org/OFL",
-	},
-	LicenseType.APACHE: {
-		"text": "This Font Software is licensed under the Apache License, Version 2.0.",
-		"url": "http://www.apache.org/licenses/LICENSE-2.0",
-	},
-	LicenseType.MIT: {
-		"text": "This Font Software is licensed under the MIT License.",
-		"url": "https://opensource.org/licenses/MIT",
-	},
-}
-
-
-def woff2_mode(input_path: str):
-	console.print(f"[bold]Converting to WOFF2:[/] {input_path}")
+# Predefined license text and URL for non-custom licenses.
+LICENSE_TEXT = MappingProxyType(
+	{
+		LicenseType.OFL: "This Font Software is licensed under the SIL Open Font License, Version 1.1.",
+		LicenseType.APACHE: "This Font Software is licensed under the Apache License, Version 2.0.",
+		LicenseType.MIT: "This Font Software is licensed under the MIT License.",
+	}
+)
+LICENSE_URL = MappingProxyType(
+	{
+		LicenseType.OFL: "http://scripts.sil.org/OFL",
+		LicenseType.APACHE: "http://www.apache.org/licenses/LICENSE-2.0",
+		LicenseType.MIT: "https://opensource.org/licenses/MIT",
+	}
+)
+
+
+# The predefined license strings, pre-encoded for Windows Unicode (3, 1) records
+LICENSE_TEXT_UTF16 = MappingProxyType(
+	{t: text.encode("utf_16_be") for t, text in LICENSE_TEXT.items()}
+)
+LICENSE_URL_UTF16 = MappingProxyType(
+	{t: url.encode("utf_16_be") for t, url in LICENSE_URL.items()}
+)
+
+# License types keyed by their upper-cased name, for case-insensitive lookup
+LICENSE_TYPES_BY_NAME = MappingProxyType(
+	{t.value.upper(): t for t in LicenseType}
+)
+
+
+def parse_license_type(name: str) -> Optional[LicenseType]:
+	"""Return the license type with this name (case-insensitive), or None."""
+	return LICENSE_TYPES_BY_NAME.get(name.upper())
+
+
+def _woff2_compress(input_path: str, quality: int) -> str:
+	"""Write a WOFF2 copy of the font next to it and return the output path."""
+	from fontTools.ttLib import TTFont
+
+	# Import the woff2 submodule for compression
+	from fontTools.ttLib import woff2
+
 	base, _ = os.path.splitext(input_path)
 	woff2_path = f"{base}.woff2"
+	# Same as woff2.compress(), but lazily loaded: tables the WOFF2 transform
+	# does not need are copied straight from the input without being parsed.
+	font = TTFont(
+		input_path, lazy=True, recalcBBoxes=False, recalcTimestamp=False
+	)
+	font.flavor = "woff2"
+	# fontTools calls brotli.compress() without a quality, i.e. at the slowest
+	# level (11); pin the requested one for the duration of the conversion.
+	brotli_compress = woff2.brotli.compress
+	woff2.brotli.compress = functools.partial(brotli_compress, quality=quality)
 	try:
-		woff2.compress(input_path, woff2_path)
-		console.print(f"[bold green]Success![/] WOFF2 file saved to {woff2_path}")
-	except Exception as e:
-		console.print(f"[bold red]Error converting to WOFF2:[/] {e}")
-		sys.exit(1)
-	sys.exit(0)
+		font.save(woff2_path, reorderTables=False)
+	finally:
+		woff2.brotli.compress = brotli_compress
+		font.close()
+	return woff2_path
+
+
+def _executor(jobs: int, tasks: int) -> Executor:
+	"""
+	Return an executor for running tasks over several fonts.
+
+	`jobs` is the number of worker processes, with 0 meaning one per CPU. With a
+	single job the tasks run one after another in this process instead.
+	"""
+	workers = min(tasks, jobs or os.cpu_count() or 1)
+	if workers <= 1:
+		return ThreadPoolExecutor(max_workers=1)
+	return ProcessPoolExecutor(max_workers=workers)
+
+
+def woff2_mode(
+	input_paths: List[str], quality: int = DEFAULT_WOFF2_QUALITY, jobs: int = 0
+):
+	if len(input_paths) == 1:
+		input_path = input_paths[0]
+		console().print(f"[bold]Converting to WOFF2:[/] {input_path}")
+		try:
+			woff2_path = _woff2_compress(input_path, quality)
+			console().print(
+				f"[bold green]Success![/] WOFF2 file saved to {woff2_path}"
+			)
+		except Exception as e:
+			console().print(f"[bold red]Error converting to WOFF2:[/] {e}")
+			sys.exit(1)
+		sys.exit(0)
+
+	# Brotli compression is CPU-bound, so convert several fonts in parallel
+	console().print(f"[bold]Converting {len(input_paths)} fonts to WOFF2[/]")
+	failed = False
+	with _executor(jobs, len(input_paths)) as pool:
+		futures = [
+			pool.submit(_woff2_compress, input_path, quality)
+			for input_path in input_paths
+		]
+		for input_path, future in zip(input_paths, futures):
+			try:
+				woff2_path = future.result()
+				console().print(f"[bold green]Success![/] {input_path} -> {woff2_path}")
+			except Exception as e:
+				console().print(
+					f"[bold red]Error converting {input_path} to WOFF2:[/] {e}"
+				)
+				failed = True
+	sys.exit(1 if failed else 0)
 
 
+@functools.lru_cache(maxsize=128)
 def get_copyright_notice(manufacturer: Optional[str] = None) -> str:
 	"""Generate a copyright notice using the manufacturer name and current year."""
-	current_year = datetime.datetime.now().year
 	if manufacturer:
-		return f"Copyright © {current_year} {manufacturer}. All Rights Reserved."
-	return f"Copyright © {current_year}. All Rights Reserved."
+		return f"Copyright © {CURRENT_YEAR} {manufacturer}. All Rights Reserved."
+	return f"Copyright © {CURRENT_YEAR}. All Rights Reserved."
 
 
-@dataclass
+@dataclass(slots=True)
 class FontToolConfig:
 	input_path: str
 	new_family: Optional[str] = None
@@ -135,207 +285,500 @@ class FontToolConfig:
 	# if left as None, then the original value is preserved.
 	trademark: Optional[str] = None
 	copyright_text: Optional[str] = None
+	# Leave every table but 'name' (including the 'head' timestamp) untouched.
+	only_name: bool = False
+	# Skip the run when the same input was already processed with the same
+	# settings and the output is unchanged since.
+	use_cache: bool = True
+
+
+def _postscript_name(family: str, subfamily: str) -> str:
+	"""Build a PostScript name ("Family-Subfamily") from family and subfamily."""
+	return (
+		f"{family.translate(PS_NAME_STRIP)}-{subfamily.translate(PS_NAME_STRIP)}"
+	)
+
+
+def _windows_name(name_id: int, text: str | bytes) -> "NameRecord":
+	"""
+	Build a Windows Unicode, US English (3, 1, 0x409) name record.
+
+	Every record this tool adds uses these IDs, so the string is encoded as
+	UTF-16BE directly instead of going through makeName/setName. Bytes are
+	taken to be UTF-16BE already and are stored as-is.
+	"""
+	from fontTools.ttLib.tables._n_a_m_e import NameRecord
+
+	record = NameRecord()
+	record.nameID = name_id
+	record.platformID = 3
+	record.platEncID = 1
+	record.langID = 0x409
+	record.string = text if isinstance(text, bytes) else text.encode("utf_16_be")
+	return record
+
+
+def _last_decodable(records: List["NameRecord"], default=None) -> Optional[str]:
+	"""
+	Return the text of the last record in `records` that decodes.
+
+	Fonts sometimes carry undecodable records; those are skipped, and `default`
+	is returned if none decodes.
+	"""
+	for record in reversed(records):
+		try:
+			return record.toUnicode()
+		except Exception:
+			pass
+	return default
+
+
+def _default_output(config: FontToolConfig, family: str, subfamily: str) -> str:
+	"""Return the default output file name, <postscript_name>.<ext>."""
+	postscript_name = _postscript_name(family, subfamily)
+	return f"{postscript_name}{os.path.splitext(config.input_path)[1]}"
 
 
-def update_font_metadata(font: TTFont, config: FontToolConfig) -> None:
+def update_font_metadata(
+	font: "TTFont", config: FontToolConfig
+) -> tuple[str, str]:
 	"""
 	Update the font's name table based on the configuration.
+
+	The allowed records are indexed by nameID once up front; every edit below
+	works on that index, which is written back to the table at the end.
+	Returns the family and subfamily in effect after the update (the configured
+	ones, or the font's originals).
+
+	Only font["name"] may be accessed here. With a lazily loaded font, any
+	other table that is touched gets decompiled and recompiled on save,
+	instead of being copied through from the reader as raw bytes.
 	"""
-	name_table = cast(table__n_a_m_e, font["name"])
+	name_table: "table__n_a_m_e" = font["name"]
 
-	# Extract original subfamily and version
-	original_subfamily = "Regular"
-	version_string: Optional[str] = None
+	# Non-essential records are dropped while indexing
+	by_id: dict[int, List["NameRecord"]] = {}
 	for record in name_table.names:
-		if record.nameID == 2:  # Subfamily
-			try:
-				original_subfamily = record.toUnicode()
-			except Exception:
-				pass
-		elif record.nameID == 5:  # Version
-			try:
-				version_string = record.toUnicode()
-			except Exception:
-				pass
+		if record.nameID in ALLOWED_NAME_IDS:
+			by_id.setdefault(record.nameID, []).append(record)
+
+	# Extract original family, subfamily and version
+	version_string = _last_decodable(by_id.get(5, ()))
+	family = config.new_family or _last_decodable(
+		by_id.get(1, ()), "UnknownFamily"
+	)
+	new_subfamily = config.subfamily or _last_decodable(
+		by_id.get(2, ()), "Regular"
+	)
 
-	new_subfamily = config.subfamily if config.subfamily else original_subfamily
+	# Encoded strings keyed by (text, encoding), so a value shared by several
+	# platform records is only encoded once per encoding.
+	encoded: dict[tuple[str, str], bytes] = {}
 
-	def update_field(name_id: int, value: Optional[str]) -> None:
-		name_table.names = [r for r in name_table.names if r.nameID != name_id]
-		if value is not None and value != "":
-			name_table.setName(value, name_id, 3, 1, 0x409)
+	def encode_for(record: "NameRecord", text: str) -> bytes:
+		# Windows Unicode (3, 1) is by far the most common case; skip the lookup.
+		if record.platformID == 3 and record.platEncID == 1:
+			encoding = "utf_16_be"
+		else:
+			encoding = record.getEncoding()
+		key = (text, encoding)
+		if key not in encoded:
+			encoded[key] = text.encode(encoding)
+		return encoded[key]
+
+	def update_field(name_id: int, value: Optional[str | bytes]) -> None:
+		# The field ends up as a single Windows English record. An existing one
+		# is reused and only its string replaced; the other records are dropped.
+		records = by_id.pop(name_id, ())
+		if not value:
+			return
+		for record in records:
+			if (record.platformID, record.platEncID, record.langID) == (3, 1, 0x409):
+				data = value if isinstance(value, bytes) else value.encode("utf_16_be")
+				if record.string != data:
+					record.string = data
+				by_id[name_id] = [record]
+				return
+		by_id[name_id] = [_windows_name(name_id, value)]
+
+	def rewrite_records(name_id: int, text: str) -> None:
+		# Rewrite the existing records in their own encodings, skipping any that
+		# already hold the value (e.g. when a font is renamed to its own name).
+		for record in by_id.get(name_id, ()):
+			data = encode_for(record, text)
+			if record.string != data:
+				record.string = data
 
 	# Update Family (1) and Typographic Family (16)
 	if config.new_family:
-		for record in name_table.names:
-			encoding = record.getEncoding()
-			if record.nameID in (1, 16):
-				record.string = config.new_family.encode(encoding)
+		rewrite_records(1, config.new_family)
+		rewrite_records(16, config.new_family)
 
 		# If subfamily is explicitly provided, override nameID=2
 		if config.subfamily:
 			update_field(2, new_subfamily)
 
 		# Rebuild Full Font Name (4) using new_family + subfamily
-		for record in name_table.names:
-			if record.nameID == 4:
-				encoding = record.getEncoding()
-				record.string = f"{config.new_family} {new_subfamily}".encode(encoding)
+		rewrite_records(4, f"{config.new_family} {new_subfamily}")
 
 		# Rebuild PostScript Name (6)
-		for record in name_table.names:
-			if record.nameID == 6:
-				encoding = record.getEncoding()
-				ps_name = f"{config.new_family.replace(' ', '')}-{new_subfamily.replace(' ', '')}"
-				record.string = ps_name.encode(encoding)
+		rewrite_records(6, _postscript_name(config.new_family, new_subfamily))
 
-	# License data
+	# License data: resolve the (text, URL) pair once; None leaves both as-is.
+	# A custom license without both text and URL is ignored.
+	license_fields: Optional[tuple] = None
 	if config.license_text is not None:
-		# Use the provided text
-		update_field(13, config.license_text)
-		update_field(14, config.license_url)
+		license_fields = (config.license_text, config.license_url)
+	elif config.license_type == LicenseType.CUSTOM:
+		if config.custom_license and config.custom_license_url:
+			license_fields = (config.custom_license, config.custom_license_url)
 	elif config.license_type is not None:
-		if (
-			config.license_type == LicenseType.CUSTOM
-			and config.custom_license
-			and config.custom_license_url
-		):
-			update_field(13, config.custom_license)
-			update_field(14, config.custom_license_url)
-		else:
-			lic_info = LICENSE_INFO.get(config.license_type)
-			if lic_info:
-				update_field(13, lic_info["text"])
-				update_field(14, lic_info["url"])
+		license_fields = (
+			LICENSE_TEXT_UTF16[config.license_type],
+			LICENSE_URL_UTF16[config.license_type],
+		)
+	if license_fields is not None:
+		update_field(13, license_fields[0])
+		update_field(14, license_fields[1])
 
 	# Other fields
 	if config.manufacturer is not None:
 		update_field(8, config.manufacturer)
 	if config.designer is not None:
 		update_field(9, config.designer)
-	update_field(7, config.trademark)  # trademark
-	update_field(0, config.copyright_text)
+	if config.trademark is not None:
+		update_field(7, config.trademark)
+	if config.copyright_text is not None:
+		update_field(0, config.copyright_text)
 
 	# Restore version
 	if version_string:
 		update_field(5, version_string)
 
-	# Filter out unneeded fields
-	name_table.names = [
-		r for r in name_table.names if r.nameID in ALLOWED_NAME_IDS
-	]
+	name_table.names = [r for records in by_id.values() for r in records]
 
+	return family, new_subfamily
 
-def interactive_mode() -> FontToolConfig:
+
+def interactive_mode() -> tuple[FontToolConfig, "TTFont"]:
 	"""
-	If no arguments are given, we prompt the user for input.
-	(Skipping for brevity. This remains same as your prior interactive approach,
-	but we won't run it if --woff2/-w is used, as that short-circuits to woff2_mode().)
+	Prompt the user for the input font and each metadata setting.
+
+	The font's current values are offered as defaults, read from its name table
+	in a single pass; accepting one leaves that field untouched. Returns the
+	config together with the opened font, so that it isn't parsed a second
+	time. Not used with --woff2/-w, which short-circuits to woff2_mode().
 	"""
-	# Just a minimal example. Adjust as needed to replicate your prior interactive logic.
-	input_path = typer.prompt("Enter the path to the input font file")
-	# If you want the rest, copy from your older version of interactive_mode
-	return FontToolConfig(input_path=input_path)
-
-
-@app.command()
-def process_font(
-	woff2_only: bool = typer.Option(
-		False,
-		"--woff2",
-		"-w",
-		help="Output WOFF2 file only, with no metadata changes or user prompts. "
-		"Example usage: font_tool.py -w input_font.ttf",
-	),
-	input_path: Optional[str] = typer.Argument(
-		None,
-		help="Path to the input .otf or .ttf font file. Ignored if using interactive mode, unless -w is used.",
-	),
-	new_family: Optional[str] = typer.Option(
-		None, "--family", "-f", help="New font family name (if modifying metadata)."
-	),
-	subfamily: Optional[str] = typer.Option(
-		None,
-		"--subfamily",
-		"-s",
-		help="Optionally specify a new subfamily (e.g. Bold, ExtraLight).",
-	),
-	output: Optional[str] = typer.Option(
-		None,
-		"--output",
-		"-o",
-		help="Optional output file path. If not provided, defaults to <postscript_name>.<ext>.",
-	),
-	license_type: LicenseType = typer.Option(
-		LicenseType.OFL,
-		"--license",
-		"-l",
-		case_sensitive=False,
-		help="License type to add to the font",
-	),
-	custom_license: Optional[str] = typer.Option(
-		None,
-		"--custom-license",
-		help="Custom license text (used when --license is 'Custom')",
-	),
-	custom_license_url: Optional[str] = typer.Option(
-		None,
-		"--custom-license-url",
-		help="Custom license URL (used when --license is 'Custom')",
-	),
-	manufacturer: Optional[str] = typer.Option(
-		None,
-		"--manufacturer",
-		"-m",
-		help="Manufacturer name to add to the font. (If not provided, existing value is preserved.)",
-	),
-	designer: Optional[str] = typer.Option(
-		None,
-		"--designer",
-		"-d",
-		help="Designer name to add to the font. (If not provided, existing value is preserved.)",
-	),
-	trademark: Optional[str] = typer.Option(
-		None,
-		"--trademark",
-		"-t",
-		help="Trademark text to add to the font. (If not provided, the field remains unchanged.)",
-	),
-	copyright_text: Optional[str] = typer.Option(
-		None,
-		"--copyright",
-		"-c",
-		help="Copyright notice to add. (If not provided, defaults to a manufacturer-based notice.)",
-	),
-):
+	from rich.prompt import Prompt
+
+	ask = functools.partial(Prompt.ask, console=console())
+
+	input_path = ask("Enter the path to the input font file")
+	# Opened like any other input: signature check first, mmap when large
+	font = _open_font(FontToolConfig(input_path=input_path))
+	try:
+		existing: dict[int, str] = {}
+		for record in font["name"].names:
+			if record.nameID in PROMPTED_NAME_IDS and record.nameID not in existing:
+				try:
+					existing[record.nameID] = record.toUnicode()
+				except Exception:
+					pass
+	except Exception as e:
+		console().print(f"[bold red]Error opening font file:[/] {e}")
+		sys.exit(1)
+
+	def ask_change(prompt: str, current: str) -> Optional[str]:
+		# Accepting the current value leaves the field alone (None), so its
+		# records on every platform are kept as they are.
+		answer = ask(prompt, default=current)
+		return None if answer == current else answer
+
+	current_family = existing.get(1, "UnknownFamily")
+	new_family = ask_change("Font family name", current_family)
+	subfamily = ask_change("Subfamily name", existing.get(2, "Regular"))
+	if subfamily and not new_family:
+		# The full and PostScript names are only rebuilt along with the family
+		new_family = current_family
+
+	license_prompt = (
+		f"License type ({', '.join(t.value for t in LicenseType)}; "
+		"empty keeps the current one)"
+	)
+	while True:
+		answer = ask(license_prompt, default="", show_default=False)
+		license_type = parse_license_type(answer) if answer else None
+		if not answer or license_type is not None:
+			break
+		console().print(f"[bold red]Unknown license type:[/] {answer}")
+	license_text: Optional[str] = None
+	license_url: Optional[str] = None
+	if license_type == LicenseType.CUSTOM:
+		license_text = ask("License text", default=existing.get(13, ""))
+		license_url = ask("License URL", default=existing.get(14, ""))
+	elif license_type is not None:
+		license_text = LICENSE_TEXT[license_type]
+		license_url = LICENSE_URL[license_type]
+
+	# Other empty answers remove the field (see FontToolConfig)
+	manufacturer = ask_change("Manufacturer", existing.get(8, ""))
+	designer = ask_change("Designer", existing.get(9, ""))
+	trademark = ask_change("Trademark", existing.get(7, ""))
+	# A font without a copyright notice is offered a generated one
+	copyright_text = ask(
+		"Copyright notice",
+		default=existing.get(0)
+		or get_copyright_notice(manufacturer or existing.get(8) or None),
+	)
+	if copyright_text == existing.get(0):
+		copyright_text = None
+	output = ask("Output file path (empty for default)", default="")
+
+	config = FontToolConfig(
+		input_path=input_path,
+		new_family=new_family,
+		subfamily=subfamily,
+		output=output or None,
+		license_text=license_text,
+		license_url=license_url,
+		manufacturer=manufacturer,
+		designer=designer,
+		trademark=trademark,
+		copyright_text=copyright_text,
+	)
+	return config, font
+
+
+def load_config_file(
+	path: str, input_path: Optional[str] = None
+) -> FontToolConfig:
 	"""
-	Process the font file: rename family/subfamily, strip non-essential metadata, add license info, etc.
-	If -w / --woff2 is used, no metadata changes are made; the script simply outputs a .woff2 file
-	and exits.
+	Build a FontToolConfig from a TOML file (or JSON, for a .json path).
+
+	Keys are FontToolConfig field names; `input_path` may be left out of the file
+	when it is given on the command line, which then takes precedence. Exits
+	with an error if the file can't be read or contains unknown settings or
+	values of the wrong type.
 	"""
-	if woff2_only:
-		# In woff2 mode: user must provide input_path as the only argument
-		if not input_path:
-			typer.echo(
-				"[bold red]Error:[/] In --woff2 mode, please specify an input font path."
+	try:
+		with open(path, "rb") as f:
+			data = json.load(f) if path.endswith(".json") else tomllib.load(f)
+	except (OSError, ValueError) as e:
+		console().print(f"[bold red]Error reading config file:[/] {e}")
+		sys.exit(1)
+	if not isinstance(data, dict):
+		console().print(
+			"[bold red]Error reading config file:[/] expected a table of settings"
+		)
+		sys.exit(1)
+
+	if input_path:
+		data["input_path"] = input_path
+	unknown = set(data) - {field.name for field in fields(FontToolConfig)}
+	if unknown:
+		console().print(
+			f"[bold red]Error reading config file:[/] unknown settings: {', '.join(sorted(unknown))}"
+		)
+		sys.exit(1)
+	if "input_path" not in data:
+		console().print(
+			"[bold red]Error reading config file:[/] no input_path in the file or on the command line"
+		)
+		sys.exit(1)
+	# Every setting is a string, apart from the on/off flags. JSON null leaves
+	# an optional setting unset.
+	flags = {field.name for field in fields(FontToolConfig) if field.type is bool}
+	for key, value in data.items():
+		if key in flags:
+			valid, expected = isinstance(value, bool), "true or false"
+		else:
+			valid = isinstance(value, str) or (value is None and key != "input_path")
+			expected = "a string"
+		if not valid:
+			console().print(
+				f"[bold red]Error reading config file:[/] {key} must be {expected}, not {value!r}"
 			)
-			raise typer.Exit(code=1)
-		woff2_mode(input_path)
-		return  # The script terminates in woff2_mode()
-
-	# Otherwise, normal (metadata editing) mode. If nothing is passed, we do interactive:
-	# (Because we used a default of None for input_path, we can detect if it's missing.)
-	if not input_path:
-		# Run interactive
-		config = interactive_mode()
-		# Possibly prompt for additional metadata changes
-		# ...
-		# Then update
-		_do_process_font(config)
-	else:
-		# Non-interactive with the provided arguments
-		_do_process_font(
-			FontToolConfig(
+			sys.exit(1)
+	if data.get("license_type") is not None:
+		license_type = parse_license_type(data["license_type"])
+		if license_type is None:
+			console().print(
+				f"[bold red]Error reading config file:[/] unknown license_type: {data['license_type']}"
+			)
+			sys.exit(1)
+		data["license_type"] = license_type
+	return FontToolConfig(**data)
+
+
+def _build_app() -> "typer.Typer":
+	"""
+	Build the command-line interface.
+
+	typer is only imported here, so that importing this module for its
+	functions does not load it.
+	"""
+	import typer
+
+	app = typer.Typer(help="Font metadata modification tool")
+
+	@app.command()
+	def process_font(
+		woff2_only: bool = typer.Option(
+			False,
+			"--woff2",
+			"-w",
+			help="Output WOFF2 file only, with no metadata changes or user prompts. "
+			"Several fonts, or a directory of them, are converted in parallel. "
+			"Example usage: font_tool.py -w input_font.ttf",
+		),
+		quality: int = typer.Option(
+			DEFAULT_WOFF2_QUALITY,
+			"--quality",
+			"-q",
+			min=0,
+			max=11,
+			help="Brotli compression quality for --woff2 output (0-11). "
+			"Higher is smaller but slower.",
+		),
+		input_paths: Optional[List[str]] = typer.Argument(
+			None,
+			metavar="INPUT_PATH...",
+			help="Path to the input .otf or .ttf font file. Several files, or a directory of fonts, are processed in parallel. Ignored if using interactive mode, unless -w is used.",
+		),
+		new_family: Optional[str] = typer.Option(
+			None,
+			"--family",
+			"-f",
+			help="New font family name (if modifying metadata).",
+		),
+		subfamily: Optional[str] = typer.Option(
+			None,
+			"--subfamily",
+			"-s",
+			help="Optionally specify a new subfamily (e.g. Bold, ExtraLight).",
+		),
+		output: Optional[str] = typer.Option(
+			None,
+			"--output",
+			"-o",
+			help="Optional output file path. If not provided, defaults to <postscript_name>.<ext>.",
+		),
+		license_type: LicenseType = typer.Option(
+			LicenseType.OFL,
+			"--license",
+			"-l",
+			case_sensitive=False,
+			help="License type to add to the font",
+		),
+		custom_license: Optional[str] = typer.Option(
+			None,
+			"--custom-license",
+			help="Custom license text (used when --license is 'Custom')",
+		),
+		custom_license_url: Optional[str] = typer.Option(
+			None,
+			"--custom-license-url",
+			help="Custom license URL (used when --license is 'Custom')",
+		),
+		manufacturer: Optional[str] = typer.Option(
+			None,
+			"--manufacturer",
+			"-m",
+			help="Manufacturer name to add to the font. (If not provided, existing value is preserved.)",
+		),
+		designer: Optional[str] = typer.Option(
+			None,
+			"--designer",
+			"-d",
+			help="Designer name to add to the font. (If not provided, existing value is preserved.)",
+		),
+		trademark: Optional[str] = typer.Option(
+			None,
+			"--trademark",
+			"-t",
+			help="Trademark text to add to the font. (If not provided, the field remains unchanged.)",
+		),
+		copyright_text: Optional[str] = typer.Option(
+			None,
+			"--copyright",
+			"-c",
+			help="Copyright notice to add. (If not provided, defaults to a manufacturer-based notice.)",
+		),
+		only_name: bool = typer.Option(
+			False,
+			"--only-name",
+			help="Recompile only the name table and keep the original modified "
+			"timestamp in 'head'; all other table data is copied from the input as-is.",
+		),
+		use_cache: bool = typer.Option(
+			True,
+			"--cache/--no-cache",
+			help="Skip fonts already processed with the same settings whose output "
+			f"is unchanged since (index kept in {CACHE_PATH}).",
+		),
+		jobs: int = typer.Option(
+			0,
+			"--jobs",
+			"-j",
+			min=0,
+			help="Worker processes used when several fonts are given "
+			"(0 = one per CPU, 1 = process them one by one in this process).",
+		),
+		config_file: Optional[str] = typer.Option(
+			None,
+			"--config",
+			help="Read all settings from a TOML (or .json) file whose keys are the "
+			"FontToolConfig fields, instead of from options or prompts. "
+			"Other metadata options are ignored; --only-name and --no-cache "
+			"still apply.",
+		),
+	):
+		"""
+		Process the font file: rename family/subfamily, strip non-essential metadata, add license info, etc.
+		If -w / --woff2 is used, no metadata changes are made; the script simply outputs a .woff2 file
+		and exits.
+		"""
+		if woff2_only:
+			# In woff2 mode: user must provide the input paths as the only arguments
+			if not input_paths:
+				typer.echo(
+					"[bold red]Error:[/] In --woff2 mode, please specify an input font path."
+				)
+				raise typer.Exit(code=1)
+			# Fonts in a directory that are already WOFF2 are left alone
+			font_paths = _expand_font_paths(input_paths, FONT_EXTENSIONS - {".woff2"})
+			if not font_paths:
+				console().print("[bold red]Error:[/] No font files found.")
+				raise typer.Exit(code=1)
+			woff2_mode(font_paths, quality, jobs)
+			return  # The script terminates in woff2_mode()
+
+		if config_file:
+			if input_paths and len(input_paths) > 1:
+				console().print(
+					"[bold red]Error:[/] --config takes at most one input font path."
+				)
+				raise typer.Exit(code=1)
+			config = load_config_file(
+				config_file, input_paths[0] if input_paths else None
+			)
+			# --only-name and --no-cache aren't metadata, so they still apply
+			config.only_name = config.only_name or only_name
+			config.use_cache = config.use_cache and use_cache
+			_do_process_font(config)
+			return
+
+		# Otherwise, normal (metadata editing) mode. If nothing is passed, we do interactive:
+		# (Because we used a default of None for input_paths, we can detect if it's missing.)
+		if not input_paths:
+			# Run interactive
+			config, font = interactive_mode()
+			_do_process_font(config, font)
+			return
+
+		def cli_config(input_path: str) -> FontToolConfig:
+			# Non-interactive with the provided arguments
+			return FontToolConfig(
 				input_path=input_path,
 				new_family=new_family,
 				subfamily=subfamily,
@@ -348,62 +791,345 @@ def process_font(
 				license_url=None,
 				manufacturer=manufacturer,
 				designer=designer,
-				trademark=trademark,
+				# The CLI has always removed the trademark and copyright unless they
+				# are given (an empty string removes the field; None would keep it)
+				trademark=trademark if trademark is not None else "",
 				# If user didn't pass a copyright, we might default:
 				copyright_text=(
 					copyright_text
 					if copyright_text is not None
-					else (get_copyright_notice(manufacturer) if manufacturer else None)
+					else (get_copyright_notice(manufacturer) if manufacturer else "")
 				),
+				only_name=only_name,
+				use_cache=use_cache,
+			)
+
+		if len(input_paths) == 1 and not os.path.isdir(input_paths[0]):
+			_do_process_font(cli_config(input_paths[0]))
+			return
+
+		# Several fonts (or a directory of them): each gets its default output name
+		if output:
+			console().print(
+				"[bold red]Error:[/] --output can't be used with several input fonts."
+			)
+			raise typer.Exit(code=1)
+		font_paths = _expand_font_paths(input_paths)
+		if not font_paths:
+			console().print("[bold red]Error:[/] No font files found.")
+			raise typer.Exit(code=1)
+		batch_mode([cli_config(path) for path in font_paths], jobs)
+
+	return app
+
+
+def _expand_font_paths(
+	paths: List[str], extensions: frozenset[str] = FONT_EXTENSIONS
+) -> List[str]:
+	"""Replace each directory in paths by the font files directly inside it."""
+	font_paths: List[str] = []
+	for path in paths:
+		if os.path.isdir(path):
+			font_paths.extend(
+				os.path.join(path, name)
+				for name in sorted(os.listdir(path))
+				if os.path.splitext(name)[1].lower() in extensions
 			)
+		else:
+			font_paths.append(path)
+	return font_paths
+
+
+def _process_font_job(config: FontToolConfig) -> tuple[bool, dict[str, str]]:
+	"""
+	Process one font of a batch.
+
+	Returns whether it succeeded, and the output to record in the cache (see
+	_store_cache), which the batch stores once all fonts are done.
+	"""
+	cache_outputs: dict[str, str] = {}
+	# _do_process_font reports its own errors and exits; keep the worker alive,
+	# and report anything else it raises so one bad font can't stop the batch
+	try:
+		_do_process_font(config, cache_outputs=cache_outputs)
+	except SystemExit as e:
+		return not e.code, cache_outputs
+	except Exception as e:
+		console().print(
+			f"[bold red]Error processing {config.input_path}:[/] {type(e).__name__}: {e}"
 		)
+		return False, cache_outputs
+	return True, cache_outputs
+
+
+def batch_mode(configs: List[FontToolConfig], jobs: int = 0) -> None:
+	"""
+	Process several fonts in one run, in parallel unless `jobs` is 1.
 
+	Each font is independent, and the fontTools work is CPU-bound Python, so
+	processes rather than threads (see _executor). Exits with status 1 if any
+	font failed.
+	"""
+	_check_batch_outputs(configs)
+	with _executor(jobs, len(configs)) as pool:
+		results = list(pool.map(_process_font_job, configs))
+	cache_outputs: dict[str, str] = {}
+	for _, outputs in results:
+		cache_outputs.update(outputs)
+	if cache_outputs:
+		_store_cache(cache_outputs)
+	failed = sum(not succeeded for succeeded, _ in results)
+	if failed:
+		console().print(f"[bold red]{failed} of {len(configs)} fonts failed.[/]")
+		sys.exit(1)
+
+
+def _check_batch_outputs(configs: List[FontToolConfig]) -> None:
+	"""
+	Exit with an error if several fonts of a batch would be saved to one file.
+
+	Default output names come from the family and subfamily, and fonts of one
+	family often share a subfamily (e.g. a Light and a Regular font both named
+	"Regular"), so those fonts' name tables are read up front. Fonts that can't
+	be read are left for their own job to report.
+	"""
+	from fontTools.ttLib import TTFont
+
+	inputs_by_output: dict[str, List[str]] = {}
+	for config in configs:
+		output = config.output
+		if not output:
+			try:
+				with TTFont(config.input_path, lazy=True) as font:
+					# The same names the job will compute; this copy is discarded
+					output = _default_output(config, *update_font_metadata(font, config))
+			except Exception:
+				continue
+		inputs_by_output.setdefault(os.path.abspath(output), []).append(
+			config.input_path
+		)
+	clashes = {o: i for o, i in inputs_by_output.items() if len(i) > 1}
+	for output, input_paths in clashes.items():
+		console().print(
+			f"[bold red]Error:[/] {', '.join(input_paths)} would all be saved to [bold]{output}[/]"
+		)
+	if clashes:
+		console().print(
+			"Process these fonts separately, each with its own --output or --subfamily."
+		)
+		sys.exit(1)
+
+
+def _cache_key(config: FontToolConfig) -> Optional[str]:
+	"""
+	Return the cache key for processing the input with this configuration.
+
+	The key covers the input's path, modification time and size, the output
+	location, and every setting that affects the output. Returns None if the input can't be stat'ed.
+	"""
+	try:
+		stat = os.stat(config.input_path)
+	except OSError:
+		return None
+	settings = asdict(config)
+	del settings["use_cache"]
+	settings["input_path"] = os.path.abspath(config.input_path)
+	# Without --output the default name is resolved against the working
+	# directory, so that is part of where the output goes.
+	settings["output"] = os.path.abspath(config.output or os.getcwd())
+	payload = json.dumps(
+		[CACHE_VERSION, settings, stat.st_mtime_ns, stat.st_size],
+		sort_keys=True,
+		default=str,
+	)
+	return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _load_cache() -> dict:
+	try:
+		with open(CACHE_PATH, encoding="utf-8") as f:
+			cache = json.load(f)
+	except (OSError, ValueError):
+		return {}
+	return cache if isinstance(cache, dict) else {}
+
+
+def _store_cache(outputs: dict[str, str]) -> None:
+	"""
+	Record the outputs written, keyed by cache key; failures are ignored.
+
+	Entries whose output no longer exists are pruned, and the index is capped
+	at CACHE_MAX_ENTRIES. The index is read and replaced without a lock, so
+	callers running in parallel must collect their outputs and store them
+	once (see batch_mode).
+	"""
+	try:
+		entries = {}
+		for key, output_path in outputs.items():
+			stat = os.stat(output_path)
+			entries[key] = {
+				"output": output_path,
+				"mtime_ns": stat.st_mtime_ns,
+				"size": stat.st_size,
+			}
+		# Drop entries whose output is gone; the new ones are added last, so
+		# they count as the newest when trimming to CACHE_MAX_ENTRIES.
+		cache = {
+			k: entry
+			for k, entry in _load_cache().items()
+			if k not in entries
+			and isinstance(entry, dict)
+			and isinstance(entry.get("output"), str)
+			and os.path.exists(entry["output"])
+		}
+		excess = len(cache) + len(entries) - CACHE_MAX_ENTRIES
+		for old_key in list(cache)[: max(excess, 0)]:
+			del cache[old_key]
+		cache.update(entries)
+		os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+		tmp_path = f"{CACHE_PATH}.{os.getpid()}.tmp"
+		with open(tmp_path, "w", encoding="utf-8") as f:
+			json.dump(cache, f)
+		os.replace(tmp_path, CACHE_PATH)
+	except OSError:
+		pass
+
+
+def _cached_output(key: str) -> Optional[str]:
+	"""Return the output recorded for this key if it is still on disk unchanged."""
+	entry = _load_cache().get(key)
+	if not entry:
+		return None
+	try:
+		stat = os.stat(entry["output"])
+	except OSError:
+		return None
+	if stat.st_mtime_ns != entry["mtime_ns"] or stat.st_size != entry["size"]:
+		return None
+	return entry["output"]
+
+
+def _open_font(config: FontToolConfig) -> "TTFont":
+	"""Open the input font for editing, exiting with an error if it can't be."""
+	from fontTools.ttLib import TTFont
+
+	# Fail fast on a mistyped path or a non-font file, before any parsing
+	try:
+		with open(config.input_path, "rb") as f:
+			signature = f.read(4)
+			size = os.fstat(f.fileno()).st_size
+	except OSError as e:
+		console().print(f"[bold red]Error opening font file:[/] {e}")
+		sys.exit(1)
+	if signature not in FONT_SIGNATURES:
+		console().print(
+			f"[bold red]Error opening font file:[/] {config.input_path} is not an OpenType or TrueType font"
+		)
+		sys.exit(1)
 
-def _do_process_font(config: FontToolConfig):
-	"""Helper to open, update, and save the font with metadata changes."""
 	try:
-		font = TTFont(config.input_path)
+		# Only the name table is edited; lazy loading leaves every other table as
+		# raw bytes, which are copied through untouched on save. The one exception
+		# is 'head', whose modified timestamp is refreshed unless only_name is set.
+		source = config.input_path
+		if size > MMAP_MIN_SIZE:
+			with open(config.input_path, "rb") as f:
+				source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+		return TTFont(source, lazy=True, recalcTimestamp=not config.only_name)
 	except Exception as e:
-		console.print(f"[bold red]Error opening font file:[/] {e}")
+		console().print(f"[bold red]Error opening font file:[/] {e}")
 		sys.exit(1)
 
-	# If no explicit output, compute a default from new_family + subfamily
-	if not config.output:
-		# We read the original subfamily to unify naming
-		original_subfamily = "Regular"
-		for rec in font["name"].names:
-			if rec.nameID == 2:
-				try:
-					original_subfamily = rec.toUnicode()
-				except Exception:
-					pass
-				break
-		used_subfam = config.subfamily if config.subfamily else original_subfamily
-		# Build default output
-		postscript_name = f"{(config.new_family or 'UnknownFamily').replace(' ', '')}-{used_subfam.replace(' ', '')}"
-		ext = os.path.splitext(config.input_path)[1]
-		config.output = f"{postscript_name}{ext}"
-
-	console.print(
+
+def _name_records(font: "TTFont") -> List[tuple]:
+	"""Return the font's name records as sorted, comparable tuples."""
+	return sorted(
+		(r.nameID, r.platformID, r.platEncID, r.langID, r.toBytes())
+		for r in font["name"].names
+	)
+
+
+def _do_process_font(
+	config: FontToolConfig,
+	font: Optional["TTFont"] = None,
+	cache_outputs: Optional[dict[str, str]] = None,
+):
+	"""
+	Helper to open, update, and save the font with metadata changes.
+
+	An already opened font (e.g. from interactive_mode()) can be passed in to
+	avoid parsing the input again. The output is recorded in the cache right
+	away, unless a `cache_outputs` dict is given to collect it in instead.
+	"""
+	cache_key = _cache_key(config) if config.use_cache else None
+	if cache_key:
+		cached_output = _cached_output(cache_key)
+		if cached_output:
+			console().print(
+				f"[bold green]Up to date:[/] [bold]{cached_output}[/] (use --no-cache to rebuild)"
+			)
+			return
+
+	if font is None:
+		font = _open_font(config)
+
+	console().print(
 		f"Modifying font metadata for: [bold]{os.path.basename(config.input_path)}[/]"
 	)
 
-	update_font_metadata(font, config)
+	original_names = _name_records(font)
+	family, subfamily = update_font_metadata(font, config)
+	unchanged = _name_records(font) == original_names
+
+	# If no explicit output, compute a default from the family and subfamily
+	if not config.output:
+		config.output = _default_output(config, family, subfamily)
+
 	output_path = os.path.abspath(config.output)
+	# Everything is written to a temporary file beside the output and renamed
+	# into place, so the output path never holds a partially written font.
+	tmp_path = f"{output_path}.{os.getpid()}.tmp"
 	try:
-		font.save(output_path)
-		console.print(
-			f"[bold green]Success![/] Processed font saved to: [bold]{output_path}[/]"
-		)
+		if unchanged:
+			# The name table already matches the configuration, so the output is
+			# simply a copy of the input; skip recompiling and re-serializing it.
+			if not (
+				os.path.exists(output_path)
+				and os.path.samefile(config.input_path, output_path)
+			):
+				shutil.copyfile(config.input_path, tmp_path)
+				os.replace(tmp_path, output_path)
+			console().print(
+				f"[bold green]No metadata changes;[/] font copied to: [bold]{output_path}[/]"
+			)
+		else:
+			# Keep the source table order rather than re-sorting the whole file.
+			# Saving to a file object also lets the output be the input itself,
+			# which stays readable (or mapped) until the rename.
+			with open(tmp_path, "wb") as f:
+				font.save(f, reorderTables=False)
+			font.close()
+			os.replace(tmp_path, output_path)
+			console().print(
+				f"[bold green]Success![/] Processed font saved to: [bold]{output_path}[/]"
+			)
 	except Exception as e:
-		console.print(f"[bold red]Error saving font file:[/] {e}")
+		if os.path.exists(tmp_path):
+			os.remove(tmp_path)
+		console().print(f"[bold red]Error saving font file:[/] {e}")
 		sys.exit(1)
 
+	if cache_key:
+		if cache_outputs is None:
+			_store_cache({cache_key: output_path})
+		else:
+			cache_outputs[cache_key] = output_path
+
 
 if __name__ == "__main__":
 	if len(sys.argv) == 1:
 		# No arguments => interactive mode
-		config = interactive_mode()
-		_do_process_font(config)
+		config, font = interactive_mode()
+		_do_process_font(config, font)
 	else:
-		app()
+		_build_app()()
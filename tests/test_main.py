@@ -0,0 +1,80 @@
+"""Tests for the name-table edits in main.py."""
+
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib import TTFont
+
+import main
+
+
+def _build_font(path) -> None:
+	"""Write a minimal two-glyph TrueType font to path."""
+	pen = TTGlyphPen(None)
+	pen.moveTo((0, 0))
+	pen.lineTo((0, 500))
+	pen.lineTo((500, 500))
+	pen.closePath()
+	glyph = pen.glyph()
+
+	builder = FontBuilder(1000, isTTF=True)
+	builder.setupGlyphOrder([".notdef", "A"])
+	builder.setupCharacterMap({0x41: "A"})
+	builder.setupGlyf({".notdef": glyph, "A": glyph})
+	builder.setupHorizontalMetrics({".notdef": (500, 0), "A": (500, 0)})
+	builder.setupHorizontalHeader(ascent=800, descent=-200)
+	builder.setupNameTable({"familyName": "Test", "styleName": "Regular"})
+	builder.setupOS2()
+	builder.setupPost()
+	builder.save(str(path))
+
+
+def _raw_tables(path) -> dict[str, bytes]:
+	"""Return the undecoded data of every table in the font at path."""
+	with TTFont(str(path), lazy=True) as font:
+		return {tag: font.reader[tag] for tag in font.reader.keys()}
+
+
+def test_update_only_loads_name(tmp_path):
+	"""Editing the metadata decompiles the name table and nothing else."""
+	input_path = tmp_path / "in.ttf"
+	_build_font(input_path)
+	config = main.FontToolConfig(
+		input_path=str(input_path),
+		new_family="Renamed",
+		subfamily="Bold",
+		manufacturer="Acme",
+		license_type=main.LicenseType.MIT,
+	)
+
+	font = main._open_font(config)
+	main.update_font_metadata(font, config)
+
+	assert set(font.tables) == {"name"}
+
+
+def test_save_copies_other_tables(tmp_path):
+	"""Tables other than name and head are copied byte for byte on save."""
+	input_path = tmp_path / "in.ttf"
+	_build_font(input_path)
+	original = _raw_tables(input_path)
+	output_path = tmp_path / "out.ttf"
+
+	main._do_process_font(
+		main.FontToolConfig(
+			input_path=str(input_path),
+			new_family="Renamed",
+			output=str(output_path),
+			only_name=True,
+			use_cache=False,
+		)
+	)
+
+	# head is always rewritten for its checksum adjustment; with only_name its
+	# modified timestamp is kept
+	processed = _raw_tables(output_path)
+	assert processed.keys() == original.keys()
+	for tag in original.keys() - {"name", "head"}:
+		assert processed[tag] == original[tag], tag
+	with TTFont(str(input_path)) as before, TTFont(str(output_path)) as after:
+		assert after["head"].modified == before["head"].modified
+		assert after["name"].getDebugName(1) == "Renamed"